@@ -3,13 +3,17 @@
 from .recursive_phase import (
     generate_phase_rotor,
     stereographic_projection,
+    stereographic_projection_batch,
     generate_platonic_solid,
+    pairwise_distances,
     verify_edge_lengths,
 )
 
 __all__ = [
     "generate_phase_rotor",
     "stereographic_projection",
+    "stereographic_projection_batch",
     "generate_platonic_solid",
+    "pairwise_distances",
     "verify_edge_lengths",
 ]
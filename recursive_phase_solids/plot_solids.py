@@ -2,28 +2,20 @@
 
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 for 3D projections
 import matplotlib.pyplot as plt
+import numpy as np
 
 from .recursive_phase import generate_platonic_solid
 
 
 def _set_axes_equal(ax):
     """Set 3D plot axes to equal scale."""
-    x_limits = ax.get_xlim3d()
-    y_limits = ax.get_ylim3d()
-    z_limits = ax.get_zlim3d()
+    limits = np.array([ax.get_xlim3d(), ax.get_ylim3d(), ax.get_zlim3d()])
+    middles = limits.mean(axis=1)
+    plot_radius = 0.5 * np.abs(limits[:, 1] - limits[:, 0]).max()
 
-    x_range = abs(x_limits[1] - x_limits[0])
-    x_middle = sum(x_limits) / 2
-    y_range = abs(y_limits[1] - y_limits[0])
-    y_middle = sum(y_limits) / 2
-    z_range = abs(z_limits[1] - z_limits[0])
-    z_middle = sum(z_limits) / 2
-
-    plot_radius = 0.5 * max([x_range, y_range, z_range])
-
-    ax.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
-    ax.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
-    ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+    ax.set_xlim3d(middles[0] - plot_radius, middles[0] + plot_radius)
+    ax.set_ylim3d(middles[1] - plot_radius, middles[1] + plot_radius)
+    ax.set_zlim3d(middles[2] - plot_radius, middles[2] + plot_radius)
 
 
 def plot_solid(name: str, ax=None):
@@ -40,10 +32,9 @@ def plot_solid(name: str, ax=None):
         fig = plt.figure()
         ax = fig.add_subplot(111, projection="3d")
     vertices = generate_platonic_solid(name)
-    xs, ys, zs = zip(*vertices)
-    ax.scatter(xs, ys, zs, color="C0")
-    for idx, (x, y, z) in enumerate(vertices):
-        ax.text(x, y, z, str(idx))
+    ax.scatter(vertices[:, 0], vertices[:, 1], vertices[:, 2], color="C0")
+    for idx, v in enumerate(vertices):
+        ax.text(v[0], v[1], v[2], str(idx))
 
     ax.set_xlabel("X")
     ax.set_ylabel("Y")
@@ -1,10 +1,26 @@
+import functools
 import math
-from typing import List, Tuple
+from typing import Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.spatial.distance import pdist
 
 
 PHI = (1 + math.sqrt(5)) / 2
+INV_PHI = 1 / PHI
+# Phase rotors ``(c, s, c, -s)`` have norm ``sqrt(2)`` since ``c**2 + s**2 == 1``.
+_INV_SQRT2 = math.sqrt(0.5)
+# Item types that mark the input of ``stereographic_projection`` as a batch.
+_BATCH_ITEM_TYPES = (list, tuple, np.ndarray)
+
+# Number of points from which ``verify_edge_lengths`` switches to the compiled
+# kernel. The kernel is not faster than ``pdist`` but avoids materialising all
+# ``N(N-1)/2`` pairwise distances, which bounds memory use on large inputs.
+_KERNEL_MIN_POINTS = 1000
 
 
+@functools.lru_cache(maxsize=128)
 def generate_phase_rotor(n: int) -> Tuple[float, float, float, float]:
     """Generate a normalized 4D phase rotor on the 3-sphere.
 
@@ -23,24 +39,32 @@ def generate_phase_rotor(n: int) -> Tuple[float, float, float, float]:
     cos_theta = math.cos(theta)
     sin_theta = math.sin(theta)
 
-    q = (cos_theta, sin_theta, cos_theta, -sin_theta)
-    norm = math.sqrt(sum(component ** 2 for component in q))
-    return tuple(component / norm for component in q)
+    c = cos_theta * _INV_SQRT2
+    s = sin_theta * _INV_SQRT2
+    return (c, s, c, -s)
 
 
-def stereographic_projection(q: Tuple[float, float, float, float]) -> Tuple[float, float, float]:
+def stereographic_projection(
+    q: Union[Tuple[float, float, float, float], ArrayLike]
+) -> Union[Tuple[float, float, float], np.ndarray]:
     """Project a point on the 3-sphere to 3D using stereographic projection.
 
     Parameters
     ----------
-    q : Tuple[float, float, float, float]
-        The 4D vector ``(x, y, z, w)`` on ``S^3``.
+    q : Tuple[float, float, float, float] or array_like
+        The 4D vector ``(x, y, z, w)`` on ``S^3``. A nested sequence or array
+        of such vectors is projected with :func:`stereographic_projection_batch`.
 
     Returns
     -------
-    Tuple[float, float, float]
-        The projected 3D vector ``(x/(1-w), y/(1-w), z/(1-w))``.
+    Tuple[float, float, float] or numpy.ndarray
+        The projected 3D vector ``(x/(1-w), y/(1-w), z/(1-w))``, or an
+        ``(..., 3)`` array for batched input.
     """
+    # A batch is recognised by its first item, which keeps the single-point
+    # path free of array conversions; rows of 2D arrays are ndarrays too.
+    if len(q) and isinstance(q[0], _BATCH_ITEM_TYPES):
+        return stereographic_projection_batch(q)
     x, y, z, w = q
     denom = 1 - w
     if denom == 0:
@@ -48,6 +72,26 @@ def stereographic_projection(q: Tuple[float, float, float, float]) -> Tuple[floa
     return (x / denom, y / denom, z / denom)
 
 
+def stereographic_projection_batch(q_array: ArrayLike) -> np.ndarray:
+    """Project many points on the 3-sphere to 3D at once.
+
+    Parameters
+    ----------
+    q_array : array_like
+        An ``(..., 4)`` array of 4D vectors ``(x, y, z, w)`` on ``S^3``.
+
+    Returns
+    -------
+    numpy.ndarray
+        An ``(..., 3)`` array of projected vectors ``(x/(1-w), y/(1-w), z/(1-w))``.
+    """
+    q = np.asarray(q_array, dtype=float)
+    w = q[..., 3]
+    if np.any(w == 1):
+        raise ValueError("Stereographic projection undefined for w = 1")
+    return q[..., :3] / (1 - w)[..., None]
+
+
 PLATONIC_SOLIDS = {
     "tetrahedron": [
         (1, 1, 1),
@@ -96,23 +140,30 @@ PLATONIC_SOLIDS = {
         (-1, 1, -1),
         (-1, -1, 1),
         (-1, -1, -1),
-        (0, 1 / PHI, PHI),
-        (0, -1 / PHI, PHI),
-        (0, 1 / PHI, -PHI),
-        (0, -1 / PHI, -PHI),
-        (PHI, 0, 1 / PHI),
-        (-PHI, 0, 1 / PHI),
-        (PHI, 0, -1 / PHI),
-        (-PHI, 0, -1 / PHI),
-        (1 / PHI, PHI, 0),
-        (-1 / PHI, PHI, 0),
-        (1 / PHI, -PHI, 0),
-        (-1 / PHI, -PHI, 0),
+        (0, INV_PHI, PHI),
+        (0, -INV_PHI, PHI),
+        (0, INV_PHI, -PHI),
+        (0, -INV_PHI, -PHI),
+        (PHI, 0, INV_PHI),
+        (-PHI, 0, INV_PHI),
+        (PHI, 0, -INV_PHI),
+        (-PHI, 0, -INV_PHI),
+        (INV_PHI, PHI, 0),
+        (-INV_PHI, PHI, 0),
+        (INV_PHI, -PHI, 0),
+        (-INV_PHI, -PHI, 0),
     ],
 }
 
+_PLATONIC_ARRAYS = {
+    name: np.asarray(coords, dtype=np.float64) for name, coords in PLATONIC_SOLIDS.items()
+}
+for _vertices in _PLATONIC_ARRAYS.values():
+    _vertices.setflags(write=False)
+del _vertices
 
-def generate_platonic_solid(name: str) -> List[Tuple[float, float, float]]:
+
+def generate_platonic_solid(name: str) -> np.ndarray:
     """Return the canonical vertex coordinates of a Platonic solid.
 
     Parameters
@@ -122,22 +173,134 @@ def generate_platonic_solid(name: str) -> List[Tuple[float, float, float]]:
 
     Returns
     -------
-    List[Tuple[float, float, float]]
-        The list of vertex coordinates for the requested solid.
+    numpy.ndarray
+        A read-only ``(N, 3)`` ``float64`` array of vertex coordinates for the
+        requested solid. The array is shared between calls; use ``.copy()``
+        if a writable version is needed.
     """
     name = name.lower()
-    if name not in PLATONIC_SOLIDS:
+    if name not in _PLATONIC_ARRAYS:
         raise ValueError(f"Unknown solid '{name}'")
-    return PLATONIC_SOLIDS[name]
+    return _PLATONIC_ARRAYS[name]
+
+
+def _as_points(points) -> np.ndarray:
+    """Return ``points`` as a C-contiguous ``float64`` array, copying only if needed."""
+    return np.ascontiguousarray(points, dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=None)
+def _pairwise_numba():
+    """Build the numba kernel used by ``pairwise_distances(backend="numba")``."""
+    try:
+        from numba import njit, prange
+    except ImportError as exc:
+        raise ImportError("backend='numba' requires numba to be installed") from exc
+
+    @njit(parallel=True, cache=True)
+    def _pairwise_condensed(pts):
+        n = pts.shape[0]
+        out = np.empty(n * (n - 1) // 2)
+        for i in prange(n):
+            # Offset of row ``i`` in the condensed upper triangle
+            start = i * (2 * n - i - 1) // 2
+            for j in range(i + 1, n):
+                acc = 0.0
+                for k in range(pts.shape[1]):
+                    diff = pts[i, k] - pts[j, k]
+                    acc += diff * diff
+                out[start + j - i - 1] = math.sqrt(acc)
+        return out
+
+    return _pairwise_condensed
+
+
+def pairwise_distances(points: ArrayLike, backend: str = "scipy") -> np.ndarray:
+    """Return the distances between all pairs of points.
+
+    Parameters
+    ----------
+    points : array_like
+        An ``(N, k)`` array of points, e.g. the ``(N, 3)`` vertices of a solid.
+    backend : str, optional
+        ``"scipy"`` uses :func:`scipy.spatial.distance.pdist`, ``"numpy"`` the
+        ``|x|^2 + |y|^2 - 2 x.y`` matrix identity, and ``"numba"`` a parallel
+        numba loop (requires numba) that fills the condensed result directly.
+
+    Returns
+    -------
+    numpy.ndarray
+        The condensed 1D array of the ``N(N-1)/2`` distances, ordered like
+        :func:`scipy.spatial.distance.pdist`.
+    """
+    pts = _as_points(points)
+    if backend == "scipy":
+        return pdist(pts)
+
+    if backend == "numpy":
+        sq_norms = np.einsum("ij,ij->i", pts, pts)
+        sq_dists = sq_norms[:, None] + sq_norms[None, :] - 2 * (pts @ pts.T)
+        np.maximum(sq_dists, 0, out=sq_dists)
+        return np.sqrt(sq_dists[np.triu_indices(pts.shape[0], 1)])
+    if backend == "numba":
+        return _pairwise_numba()(pts)
+    raise ValueError(f"Unknown backend '{backend}'")
+
+
+def _min_and_max_dev(pts, tolerance):
+    """Return the shortest edge and the largest deviation among near-minimal edges.
+
+    Works on a contiguous ``(N, 3)`` ``float64`` array with ``N >= 2`` without
+    building the full list of pairwise distances. See :func:`_edge_kernel` for
+    the compiled version.
+    """
+    n = pts.shape[0]
+    # Start from an actual pair: fastmath lets the compiler assume no infinities
+    dx = pts[0, 0] - pts[1, 0]
+    dy = pts[0, 1] - pts[1, 1]
+    dz = pts[0, 2] - pts[1, 2]
+    min_d2 = dx * dx + dy * dy + dz * dz
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = pts[i, 0] - pts[j, 0]
+            dy = pts[i, 1] - pts[j, 1]
+            dz = pts[i, 2] - pts[j, 2]
+            d2 = dx * dx + dy * dy + dz * dz
+            if d2 < min_d2:
+                min_d2 = d2
+
+    min_d = math.sqrt(min_d2)
+    cutoff2 = (min_d + 10 * tolerance) ** 2
+    max_d2 = min_d2
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = pts[i, 0] - pts[j, 0]
+            dy = pts[i, 1] - pts[j, 1]
+            dz = pts[i, 2] - pts[j, 2]
+            d2 = dx * dx + dy * dy + dz * dz
+            if d2 <= cutoff2 and d2 > max_d2:
+                max_d2 = d2
+    return min_d, math.sqrt(max_d2) - min_d
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_kernel():
+    """Return ``_min_and_max_dev`` compiled with numba, or ``None`` without numba."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional
+        return None
+    return njit(fastmath=True, cache=True)(_min_and_max_dev)
 
 
-def verify_edge_lengths(points: List[Tuple[float, float, float]], tolerance: float = 1e-5) -> bool:
+def verify_edge_lengths(points: ArrayLike, tolerance: float = 1e-5) -> bool:
     """Verify that the shortest edges of a polyhedron are equal in length.
 
     Parameters
     ----------
-    points : List[Tuple[float, float, float]]
-        The list of 3D vertices ``(x, y, z)``.
+    points : array_like
+        The vertices ``(x, y, z)``, e.g. a list of tuples or an ``(N, 3)`` array
+        as returned by :func:`generate_platonic_solid`.
     tolerance : float, optional
         Absolute tolerance used when comparing edge lengths.
 
@@ -148,28 +311,36 @@ def verify_edge_lengths(points: List[Tuple[float, float, float]], tolerance: flo
         otherwise. In the failing case the mismatched edge lengths are printed.
     """
 
-    if len(points) < 2:
+    pts = _as_points(points)
+    if len(pts) < 2:
         return True
 
-    distances = []
-    for i in range(len(points)):
-        for j in range(i + 1, len(points)):
-            d = math.dist(points[i], points[j])
-            distances.append(d)
+    # The kernel is written for 3D points; other dimensions go through pdist
+    use_kernel = len(pts) >= _KERNEL_MIN_POINTS and pts.ndim == 2 and pts.shape[1] == 3
+    kernel = _edge_kernel() if use_kernel else None
+    if kernel is not None:
+        _, max_dev = kernel(pts, tolerance)
+        if max_dev <= tolerance:
+            return True
+        # Fall through to the pdist path to report the mismatched edges.
 
-    min_dist = min(distances)
+    # Work with squared distances; the ordering is the same as for distances
+    sq_distances = pdist(pts, metric="sqeuclidean")
+    min_dist = math.sqrt(sq_distances.min())
     # Consider all edges whose length is close to the minimum distance
-    candidate_edges = [d for d in distances if d <= min_dist + 10 * tolerance]
+    cutoff2 = (min_dist + 10 * tolerance) ** 2
+    candidate_sq = sq_distances[sq_distances <= cutoff2]
 
-    if not candidate_edges:
+    if candidate_sq.size == 0:
         return True
 
-    expected = min(candidate_edges)
-    max_dev = max(abs(d - expected) for d in candidate_edges)
-    if max_dev <= tolerance:
+    # Deviations are measured from the shortest candidate, so the largest
+    # one only needs the square root of the longest candidate.
+    if math.sqrt(candidate_sq.max()) - min_dist <= tolerance:
         return True
 
-    mismatched = [d for d in candidate_edges if abs(d - expected) > tolerance]
+    candidate_edges = np.sqrt(candidate_sq)
+    mismatched = candidate_edges[candidate_edges - min_dist > tolerance].tolist()
     print("Mismatched edge lengths:", mismatched)
     return False
 
@@ -177,6 +348,8 @@ def verify_edge_lengths(points: List[Tuple[float, float, float]], tolerance: flo
 __all__ = [
     "generate_phase_rotor",
     "stereographic_projection",
+    "stereographic_projection_batch",
     "generate_platonic_solid",
+    "pairwise_distances",
     "verify_edge_lengths",
 ]
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+
+from recursive_phase_solids import recursive_phase
+
+
+def _grid(n):
+    axis = np.arange(float(n))
+    return np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+
+
+def _pdist_min_and_max_dev(pts, tolerance):
+    dists = pdist(pts)
+    candidates = dists[dists <= dists.min() + 10 * tolerance]
+    return dists.min(), candidates.max() - candidates.min()
+
+
+@pytest.mark.parametrize("perturbation", [0.0, 1e-4])
+def test_edge_kernel_matches_pdist_on_perturbed_grid(perturbation):
+    pts = _grid(6)
+    pts[0, 0] += perturbation
+    tolerance = 1e-3
+
+    min_d, max_dev = recursive_phase._min_and_max_dev(pts, tolerance)
+
+    expected_min, expected_dev = _pdist_min_and_max_dev(pts, tolerance)
+    assert min_d == pytest.approx(expected_min)
+    assert max_dev == pytest.approx(expected_dev, abs=1e-12)
+
+
+@pytest.mark.parametrize("perturbation", [0.0, 1e-4])
+def test_compiled_edge_kernel_matches_pdist_on_perturbed_grid(perturbation):
+    pytest.importorskip("numba")
+    pts = _grid(10)
+    pts[0, 0] += perturbation
+    tolerance = 1e-3
+
+    min_d, max_dev = recursive_phase._edge_kernel()(pts, tolerance)
+
+    expected_min, expected_dev = _pdist_min_and_max_dev(pts, tolerance)
+    assert min_d == pytest.approx(expected_min)
+    assert max_dev == pytest.approx(expected_dev, abs=1e-12)
+
+
+def test_verify_edge_lengths_kernel_path_reports_mismatches(monkeypatch, capsys):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(recursive_phase, "_KERNEL_MIN_POINTS", 1000)
+    pts = _grid(10)
+    assert recursive_phase.verify_edge_lengths(pts)
+    assert capsys.readouterr().out == ""
+
+    pts[0, 0] += 1e-4
+    assert not recursive_phase.verify_edge_lengths(pts)
+    assert capsys.readouterr().out.startswith("Mismatched edge lengths:")
+
+
+@pytest.mark.parametrize("shape", [(30, 40), (10, 10, 3, 4)])
+def test_verify_edge_lengths_large_non_3d_points_use_pdist(shape):
+    pts = np.indices(shape, dtype=float).reshape(len(shape), -1).T.copy()
+    assert len(pts) >= recursive_phase._KERNEL_MIN_POINTS
+    assert recursive_phase.verify_edge_lengths(pts)
+
+    pts[1, -1] += 3e-5
+    assert not recursive_phase.verify_edge_lengths(pts)
+
+
+@pytest.mark.parametrize("backend", ["scipy", "numpy", "numba"])
+@pytest.mark.parametrize("n_points", [0, 1, 2, 57])
+def test_pairwise_distances_backends_match_pdist(backend, n_points):
+    if backend == "numba":
+        pytest.importorskip("numba")
+    pts = np.random.default_rng(0).normal(size=(n_points, 3))
+
+    dists = recursive_phase.pairwise_distances(pts, backend=backend)
+
+    assert dists.shape == (n_points * (n_points - 1) // 2,)
+    np.testing.assert_allclose(dists, pdist(pts), rtol=1e-12, atol=1e-12)
+
+
+def test_pairwise_distances_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        recursive_phase.pairwise_distances(np.zeros((2, 3)), backend="cuda")
+
+
+def test_stereographic_projection_batch_matches_scalar():
+    rotors = [recursive_phase.generate_phase_rotor(n) for n in range(6)]
+
+    projected = recursive_phase.stereographic_projection_batch(rotors)
+
+    assert projected.shape == (6, 3)
+    expected = [recursive_phase.stereographic_projection(q) for q in rotors]
+    np.testing.assert_allclose(projected, expected)
+
+
+@pytest.mark.parametrize("container", [list, np.asarray])
+def test_stereographic_projection_delegates_batched_input(container):
+    rotors = [recursive_phase.generate_phase_rotor(n) for n in range(3)]
+
+    projected = recursive_phase.stereographic_projection(container(rotors))
+
+    np.testing.assert_allclose(projected, recursive_phase.stereographic_projection_batch(rotors))
+
+
+@pytest.mark.parametrize("container", [tuple, list, np.asarray])
+def test_stereographic_projection_single_point_returns_tuple(container):
+    projected = recursive_phase.stereographic_projection(container((0.5, 0.5, 0.5, 0.5)))
+
+    assert isinstance(projected, tuple)
+    assert projected == pytest.approx((1.0, 1.0, 1.0))
+
+
+def test_stereographic_projection_batch_rejects_north_pole():
+    with pytest.raises(ValueError):
+        recursive_phase.stereographic_projection_batch([(0.0, 0.0, 0.0, 1.0), (1.0, 0.0, 0.0, 0.0)])
+
+
+@pytest.mark.parametrize("name", ["tetrahedron", "cube", "octahedron", "icosahedron", "dodecahedron"])
+def test_generate_platonic_solid_returns_shared_read_only_array(name):
+    vertices = recursive_phase.generate_platonic_solid(name)
+
+    assert vertices.dtype == np.float64
+    assert vertices.shape == (len(recursive_phase.PLATONIC_SOLIDS[name]), 3)
+    assert vertices is recursive_phase.generate_platonic_solid(name.upper())
+    np.testing.assert_array_equal(vertices, recursive_phase.PLATONIC_SOLIDS[name])
+    with pytest.raises(ValueError):
+        vertices[0, 0] = 0.0
+
+    vertices.copy()[0, 0] = 0.0
+
+
+@pytest.mark.parametrize("name", ["tetrahedron", "cube", "octahedron", "icosahedron", "dodecahedron"])
+def test_verify_edge_lengths_accepts_arrays_and_lists(name):
+    vertices = recursive_phase.generate_platonic_solid(name)
+
+    assert recursive_phase.verify_edge_lengths(vertices)
+    assert recursive_phase.verify_edge_lengths([tuple(v) for v in vertices.tolist()])
+
+
+def test_generate_platonic_solid_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        recursive_phase.generate_platonic_solid("sphere")
+
+
+@pytest.mark.parametrize("backend", ["scipy", "numpy", "numba"])
+@pytest.mark.parametrize("dim", [2, 4])
+def test_pairwise_distances_backends_accept_any_dimension(backend, dim):
+    if backend == "numba":
+        pytest.importorskip("numba")
+    pts = np.random.default_rng(1).normal(size=(20, dim))
+
+    dists = recursive_phase.pairwise_distances(pts, backend=backend)
+
+    np.testing.assert_allclose(dists, pdist(pts), rtol=1e-12, atol=1e-12)